@@ -9,14 +9,24 @@ Therefore, this hook will not be invoked to download a configuration. However, t
 applications, frameworks and engines can be downloaded through the hook.
 """
 
+import errno
+import hashlib
 import os
 import zipfile
 import json
 import platform
 import re
+import shutil
+import time
 
 from sgtk import get_hook_baseclass
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    # Not available with Python 2, assets are then downloaded one by one.
+    ThreadPoolExecutor = None
+
 
 _SIX_IMPORT_WARNING = (
     "Unable to import six.moves from tk-core, this can happen "
@@ -24,18 +34,76 @@ _SIX_IMPORT_WARNING = (
     "pipeline configuration. Falling back on using urllib2."
 )
 
+# Size of the chunks read from the network when downloading assets.
+_DOWNLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Maximum number of assets downloaded in parallel.
+_MAX_DOWNLOAD_WORKERS = 4
+
+# Assets bigger than this size are downloaded in multiple parts in parallel,
+# when they are the only asset to download.
+_SPLIT_DOWNLOAD_MIN_SIZE = 2 * _DOWNLOAD_CHUNK_SIZE
+
+# Number of parts large assets are split into.
+_SPLIT_DOWNLOAD_PARTS = 4
+
+# Git descriptor types, and the prefix for their paths pointing to Github repos.
+_GIT_DESCRIPTOR_TYPES = ("git", "git_branch")
+_GITHUB_SSH_PREFIX = "git@github.com:"
+
+# Github release assets keys we need and cache.
+_CACHED_ASSET_KEYS = ("name", "url", "size", "digest")
+
+# Timeout in seconds for url requests.
+_URL_TIMEOUT = 60
+
+# HTTP errors for which url requests are retried, how many times they are
+# retried and the delay in seconds before the first retry, doubled for each
+# subsequent retry.
+_RETRY_HTTP_CODES = (502, 503, 504)
+_MAX_URL_RETRIES = 5
+_URL_RETRY_DELAY = 0.5
+
+# Platform name used in Github release assets names.
+_PLATFORM_NAME = {
+    "Darwin": "osx",
+    "Linux": "linux",
+    "Windows": "win"
+}.get(platform.system())
+
+# Number of seconds during which a cached Github release is used without
+# checking if it was changed.
+_RELEASE_CACHE_TTL = 24 * 60 * 60
+
+
+def _ensure_folder_exists(path):
+    """
+    Create the given folder and its parents if they do not exist.
+
+    This is safe to call concurrently for the same folder.
+
+    :param str path: Full path to a folder.
+    """
+    try:
+        os.makedirs(path)
+    except OSError as e:
+        if e.errno != errno.EEXIST or not os.path.isdir(path):
+            raise
+
 
 class Bootstrap(get_hook_baseclass()):
     """
     Override the bootstrap core hook to cache some bundles ourselves.
     http://developer.shotgunsoftware.com/tk-core/core.html#bootstrap.Bootstrap
     """
-    # List of github repos for which we download releases, with a github token to
+    # Github repos for which we download releases, with a github token to
     # do the download if the repo is private
-    _download_release_from_github = [
-        ("ue4plugins/tk-framework-unrealqt", ""),
-        ("GPLgithub/tk-framework-unrealqt", ""),
-    ]
+    _download_release_from_github = {
+        "ue4plugins/tk-framework-unrealqt": "",
+        "GPLgithub/tk-framework-unrealqt": "",
+    }
+    # The url opener used for all requests, see _open_url.
+    _opener = None
 
     def can_cache_bundle(self, descriptor):
         """
@@ -51,7 +119,6 @@ class Bootstrap(get_hook_baseclass()):
         :returns: ``True`` if the bundle can be cached with this hook, ``False``
                   if not.
         :rtype: bool
-        :raises RuntimeError: If six.moves is not available.
         """
         descd = descriptor.get_dict()
         return bool(self._should_download_release(descd))
@@ -73,18 +140,7 @@ class Bootstrap(get_hook_baseclass()):
 
         :param descriptor: Descriptor of the bundle that needs to be cached.
         """
-        # This logic can be removed once we can assume tk-core is > v0.19.1 not
-        # just in configs but also in the bundled Shotgun.app.
-        try:
-            from tank_vendor.six.moves.urllib import request as url2
-            from tank_vendor.six.moves.urllib import error as error_url2
-        except ImportError as e:
-            self.logger.warning(_SIX_IMPORT_WARNING)
-            self.logger.debug("%s" % e, exc_info=True)
-            # Fallback on using urllib2
-            import urllib2 as url2
-            import urllib2 as error_url2
-
+        url2, error_url2 = self._import_urllib()
         descd = descriptor.get_dict()
         version = descriptor.version
         self.logger.info("Treating %s" % descd)
@@ -93,31 +149,55 @@ class Bootstrap(get_hook_baseclass()):
             raise RuntimeError("Don't know how to download %s" % descd)
         name = specs[0]
         token = specs[1]
+        cache_path = None
+        # The release data and ETag to cache, only written once the release
+        # assets were successfully extracted.
+        cache_update = None
         try:
-            if self.shotgun.config.proxy_handler:
-                # Re-use proxy settings from the Shotgun connection
-                opener = url2.build_opener(
-                    self.parent.shotgun.config.proxy_handler,
-                )
-                url2.install_opener(opener)
-
-            # Retrieve the release from the tag
-            url = "https://api.github.com/repos/%s/releases/tags/%s" % (name, version)
-            request = url2.Request(url)
-            # Add the authorization token if we have one (private repos)
-            if token:
-                request.add_header("Authorization", "token %s" % token)
-            request.add_header("Accept", "application/vnd.github.v3+json")
-            try:
-                response = url2.urlopen(request)
-            except error_url2.URLError as e:
-                if hasattr(e, "code"):
-                    if e.code == 404:
-                        self.logger.error("Release %s does not exists" % version)
-                    elif e.code == 401:
-                        self.logger.error("Not authorised to access release %s." % version)
-                raise
-            response_d = json.loads(response.read())
+            # Released tags are not supposed to change, so we cache them and
+            # only check from time to time if they were modified.
+            cache_path = self._get_release_cache_path(name, version)
+            response_d, etag, expired = self._read_release_cache(cache_path)
+            if response_d and not expired:
+                self.logger.debug("Using cached release %s" % cache_path)
+            else:
+                # Retrieve the release from the tag
+                url = "https://api.github.com/repos/%s/releases/tags/%s" % (name, version)
+                request = url2.Request(url)
+                # Add the authorization token if we have one (private repos)
+                if token:
+                    request.add_header("Authorization", "token %s" % token)
+                request.add_header("Accept", "application/vnd.github.v3+json")
+                if response_d and etag:
+                    request.add_header("If-None-Match", etag)
+                response = None
+                try:
+                    response = self._open_url(request)
+                except error_url2.URLError as e:
+                    code = getattr(e, "code", None)
+                    # A 304 means the cached release was not modified.
+                    if code != 304 or not response_d:
+                        if code == 404:
+                            self.logger.error("Release %s does not exists" % version)
+                        elif code == 401:
+                            self.logger.error("Not authorised to access release %s." % version)
+                        raise
+                if response:
+                    response_d = json.loads(response.read())
+                    # Only keep what we need from the release, which can be
+                    # quite large with its description and all its assets
+                    # details, so reading it back from the cache is cheap.
+                    response_d = {
+                        "assets": [
+                            dict((k, asset.get(k)) for k in _CACHED_ASSET_KEYS)
+                            for asset in response_d["assets"]
+                        ]
+                    }
+                    cache_update = (response_d, response.info().get("ETag"))
+                else:
+                    self.logger.debug("Cached release %s is up to date" % cache_path)
+                    # Just flag the cached release as up to date.
+                    cache_update = (None, None)
             # Look up for suitable assets for this platform. Assets names
             # follow this convention:
             #  <version>-py<python version>-<platform>.zip
@@ -125,29 +205,16 @@ class Bootstrap(get_hook_baseclass()):
             # the current platform and version. We're assuming that the cached
             # config for a user will never be shared between machines with
             # different os.
-            pname = {
-                "Darwin": "osx",
-                "Linux": "linux",
-                "Windows": "win"
-            }.get(platform.system())
-
+            pname = _PLATFORM_NAME
             if not pname:
                 raise ValueError("Unsupported platform %s" % platform.system())
 
+            asset_regex = re.compile(
+                r"^%s-py\d+\.\d+-%s\.zip$" % (re.escape(version), re.escape(pname))
+            )
             extracted = []
             for asset in response_d["assets"]:
-                name = asset["name"]
-                m = re.match(
-                    r"%s-py\d.\d-%s.zip" % (version, pname),
-                    name
-                )
-                if m:
-                    # Download the asset payload
-                    self._download_zip_github_asset(
-                        asset,
-                        destination,
-                        token
-                    )
+                if asset_regex.match(asset["name"]):
                     extracted.append(asset)
 
             if not extracted:
@@ -156,15 +223,54 @@ class Bootstrap(get_hook_baseclass()):
                         a["name"] for a in response_d["assets"]
                     ]
                 )
+            _ensure_folder_exists(destination)
+            # Download the assets payloads, in parallel if we can.
+            if ThreadPoolExecutor and len(extracted) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(_MAX_DOWNLOAD_WORKERS, len(extracted))
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            self._download_zip_github_asset,
+                            asset,
+                            destination,
+                            token
+                        ) for asset in extracted
+                    ]
+                    # Re-raise errors, if any.
+                    zip_files = [future.result() for future in futures]
+            else:
+                zip_files = [
+                    self._download_zip_github_asset(
+                        asset,
+                        destination,
+                        token,
+                        split=True
+                    ) for asset in extracted
+                ]
+            # Extract the archives one after the other, in the release assets
+            # order, so files shared by several assets are never written
+            # concurrently and the last asset wins.
+            for zip_file in zip_files:
+                self._extract_zip(zip_file, destination)
+                # The archive is not needed anymore once extracted.
+                os.remove(zip_file)
             self.logger.info(
                 "Extracted files: %s from %s" % (
                     os.listdir(destination),
                     ",".join([a["name"] for a in extracted])
                 )
             )
+            if cache_update:
+                self._write_release_cache(cache_path, *cache_update)
         except Exception as e:
             # Log the exception with the backtrace because TK obfuscates it.
             self.logger.exception(e)
+            # Don't keep a release which might be the cause of the failure,
+            # e.g. a release whose assets were not uploaded yet, or were
+            # replaced since it was cached.
+            if cache_path:
+                self._clear_release_cache(cache_path)
             raise
 
     def _should_download_release(self, desc):
@@ -180,74 +286,380 @@ class Bootstrap(get_hook_baseclass()):
             if not desc.get("organization") or not desc.get("repository"):
                 return None
             desc_path = "%s/%s" % (desc["organization"], desc["repository"])
-            for name, token in self._download_release_from_github:
-                if name == desc_path:
-                    return name, token
-        elif desc.get("path"):
+        elif desc["type"] in _GIT_DESCRIPTOR_TYPES and desc.get("path"):
             # Check the path for a git descriptor
             desc_path = desc["path"]
-            for name, token in self._download_release_from_github:
-                if "git@github.com:%s.git" % name == desc_path:
-                    return name, token
-        return None
+            if not desc_path.startswith(_GITHUB_SSH_PREFIX) or not desc_path.endswith(".git"):
+                return None
+            desc_path = desc_path[len(_GITHUB_SSH_PREFIX):-len(".git")]
+        else:
+            return None
+        token = self._download_release_from_github.get(desc_path)
+        if token is None:
+            return None
+        return desc_path, token
 
-    def _download_zip_github_asset(self, asset, destination, token):
+    def _import_urllib(self):
         """
-        Download the zipped github asset and extract it into the given destination
-        folder.
+        Import the urllib modules to use.
 
-        Assets can be retrieved with the releases github REST api endpoint.
-        https://developer.github.com/v3/repos/releases/#get-a-release-by-tag-name
-
-        :param str asset: A Github asset dictionary.
-        :param str destination: Full path to a folder where to extract the downloaded
-                            zipped archive. The folder is created if it does not
-                            exist.
-        :param str token: A Github OAuth or personal token.
+        :returns: The urllib request and error modules.
         """
+        # This logic can be removed once we can assume tk-core is > v0.19.1 not
+        # just in configs but also in the bundled Shotgun.app.
         try:
             from tank_vendor.six.moves.urllib import request as url2
+            from tank_vendor.six.moves.urllib import error as error_url2
         except ImportError as e:
             self.logger.warning(_SIX_IMPORT_WARNING)
             self.logger.debug("%s" % e, exc_info=True)
             # Fallback on using urllib2
             import urllib2 as url2
-        # If we have a token use a basic auth handler
-        # just a http handler otherwise
-        if token:
-            passman = url2.HTTPPasswordMgrWithDefaultRealm()
-            passman.add_password(
-                None,
-                asset["url"],
-                token,
-                token
+            import urllib2 as error_url2
+        return url2, error_url2
+
+    def _open_url(self, request):
+        """
+        Open the given request, retrying a few times on transient server errors.
+
+        A single opener is used for all requests, it is not installed globally
+        so we don't interfere with other code, and can be used from multiple
+        threads.
+
+        :param request: A urllib request.
+        :returns: A urllib response.
+        """
+        if self._opener is None:
+            url2, _ = self._import_urllib()
+            if self.shotgun.config.proxy_handler:
+                # Re-use proxy settings from the Shotgun connection
+                self._opener = url2.build_opener(
+                    self.parent.shotgun.config.proxy_handler,
+                )
+            else:
+                self._opener = url2.build_opener()
+        attempt = 0
+        while True:
+            try:
+                return self._opener.open(request, timeout=_URL_TIMEOUT)
+            except Exception as e:
+                if (
+                    getattr(e, "code", None) not in _RETRY_HTTP_CODES
+                    or attempt >= _MAX_URL_RETRIES
+                ):
+                    raise
+                delay = _URL_RETRY_DELAY * 2 ** attempt
+                self.logger.debug(
+                    "Retrying %s in %ss after error %s" % (
+                        request.get_full_url(), delay, e
+                    )
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    def _get_release_cache_path(self, name, version):
+        """
+        Return the path to the file used to cache the given Github release.
+
+        :param str name: A Github repo name, e.g. ``ue4plugins/tk-framework-unrealqt``.
+        :param str version: The release tag.
+        :returns: Full path to a json file.
+        """
+        from sgtk.util import LocalFileStorageManager
+
+        return os.path.join(
+            LocalFileStorageManager.get_global_root(LocalFileStorageManager.CACHE),
+            "github_releases",
+            name.replace("/", os.path.sep),
+            "%s.json" % version,
+        )
+
+    def _read_release_cache(self, cache_path):
+        """
+        Read a Github release from the given cache file.
+
+        :param str cache_path: Full path to a cache file.
+        :returns: A release dictionary, its ETag and whether or not the cached
+                  release should be checked for changes. The release and the
+                  ETag are ``None`` if they can't be read from the cache.
+        """
+        try:
+            if not os.path.isfile(cache_path):
+                return None, None, True
+            with open(cache_path, "r") as f:
+                release = json.load(f)
+            etag = None
+            if os.path.isfile("%s.etag" % cache_path):
+                with open("%s.etag" % cache_path, "r") as f:
+                    etag = f.read().strip() or None
+            expired = time.time() - os.path.getmtime(cache_path) > _RELEASE_CACHE_TTL
+            return release, etag, expired
+        except Exception as e:
+            # Caching is just an optimization, never fail because of it.
+            self.logger.debug(
+                "Unable to read cached release %s: %s" % (cache_path, e),
+                exc_info=True
             )
-            auth_handler = url2.HTTPBasicAuthHandler(passman)
-        else:
-            auth_handler = url2.HTTPHandler()
+            return None, None, True
+
+    def _write_release_cache(self, cache_path, release=None, etag=None):
+        """
+        Cache a Github release in the given cache file.
+
+        :param str cache_path: Full path to a cache file.
+        :param release: A release dictionary. If ``None`` the current cached
+                        data is kept and just flagged as up to date.
+        :param str etag: Optional ETag returned by Github for the release.
+        """
+        try:
+            if release is None:
+                os.utime(cache_path, None)
+                return
+            _ensure_folder_exists(os.path.dirname(cache_path))
+            with open(cache_path, "w") as f:
+                json.dump(release, f)
+            etag_path = "%s.etag" % cache_path
+            if etag:
+                with open(etag_path, "w") as f:
+                    f.write(etag)
+            elif os.path.isfile(etag_path):
+                os.remove(etag_path)
+        except Exception as e:
+            # Caching is just an optimization, never fail because of it.
+            self.logger.debug(
+                "Unable to cache release %s: %s" % (cache_path, e),
+                exc_info=True
+            )
+
+    def _clear_release_cache(self, cache_path):
+        """
+        Remove a Github release from the given cache file, if cached.
+
+        :param str cache_path: Full path to a cache file.
+        """
+        for path in (cache_path, "%s.etag" % cache_path):
+            try:
+                if os.path.isfile(path):
+                    os.remove(path)
+            except Exception as e:
+                # Caching is just an optimization, never fail because of it.
+                self.logger.debug(
+                    "Unable to remove cached release %s: %s" % (path, e),
+                    exc_info=True
+                )
+
+    def _download_zip_github_asset(self, asset, destination, token, split=False):
+        """
+        Download the zipped github asset into the given destination folder.
+
+        Assets can be retrieved with the releases github REST api endpoint.
+        https://developer.github.com/v3/repos/releases/#get-a-release-by-tag-name
 
-        if self.shotgun.config.proxy_handler:
-            # Re-use proxy settings from the Shotgun connection
-            opener = url2.build_opener(
-                self.parent.shotgun.config.proxy_handler,
-                auth_handler
+        :param str asset: A Github asset dictionary.
+        :param str destination: Full path to a folder where to download the
+                            zipped archive. The folder is created if it does not
+                            exist.
+        :param str token: A Github OAuth or personal token.
+        :param bool split: If ``True``, large assets are downloaded in multiple
+                           parts in parallel.
+        :returns: Full path to the downloaded zip archive.
+        :raises RuntimeError: If the download is incomplete or corrupted.
+        """
+        url2, _ = self._import_urllib()
+        size = asset.get("size") or 0
+        split = split and ThreadPoolExecutor and size >= _SPLIT_DOWNLOAD_MIN_SIZE
+        request = self._get_asset_request(url2, asset, token)
+        if split:
+            # Only request the first part, the other parts are requested if
+            # the server honours the range.
+            part_size = -(-size // _SPLIT_DOWNLOAD_PARTS)
+            request.add_header("Range", "bytes=0-%d" % (part_size - 1))
+        response = self._open_url(request)
+        _ensure_folder_exists(destination)
+        tmp_file = os.path.join(destination, asset["name"])
+        sha256 = hashlib.sha256()
+        if split and response.getcode() == 206:
+            downloaded = self._download_split_asset(
+                url2, asset, token, response, part_size, tmp_file, sha256
             )
         else:
-            opener = url2.build_opener(auth_handler)
+            with open(tmp_file, "wb") as f:
+                # Stream the payload to disk instead of loading it in memory.
+                downloaded = self._copy_chunks(response, f, sha256)
+        # Catch truncated or corrupted downloads before they are extracted.
+        self._check_downloaded_asset(asset, downloaded, sha256)
+        return tmp_file
 
-        url2.install_opener(opener)
+    def _get_asset_request(self, url2, asset, token):
+        """
+        Return a request to download the given Github asset.
+
+        :param url2: The urllib request module to use.
+        :param str asset: A Github asset dictionary.
+        :param str token: A Github OAuth or personal token.
+        :returns: A urllib request.
+        """
         request = url2.Request(asset["url"])
         if token:
             # We will be redirected and the Auth shouldn't be in the header
             # for the redirection.
             request.add_unredirected_header("Authorization", "token %s" % token)
         request.add_header("Accept", "application/octet-stream")
-        response = url2.urlopen(request)
-        if not os.path.exists(destination):
-            self.logger.info("Creating %s" % destination)
-            os.makedirs(destination)
-        tmp_file = os.path.join(destination, asset["name"])
+        return request
+
+    def _download_split_asset(
+        self, url2, asset, token, first_response, part_size, tmp_file, sha256
+    ):
+        """
+        Download the given Github asset in multiple parts in parallel.
+
+        :param url2: The urllib request module to use.
+        :param str asset: A Github asset dictionary.
+        :param str token: A Github OAuth or personal token.
+        :param first_response: The response for the already requested first part.
+        :param int part_size: The size of each part.
+        :param str tmp_file: Full path to the file to download the asset to.
+        :param sha256: A hashlib sha256 object, updated with the downloaded
+                       data if the asset has a sha256 digest to check.
+        :returns: The number of downloaded bytes.
+        :raises RuntimeError: If a part can't be downloaded.
+        """
+        size = asset["size"]
         with open(tmp_file, "wb") as f:
-            f.write(response.read())
-        with zipfile.ZipFile(tmp_file, "r") as zip_ref:
-            zip_ref.extractall(destination)
+            f.truncate(size)
+
+        def download_part(response, start):
+            with open(tmp_file, "r+b") as f:
+                f.seek(start)
+                downloaded = self._copy_chunks(response, f)
+            expected = min(part_size, size - start)
+            if downloaded != expected:
+                raise RuntimeError(
+                    "Downloaded %d bytes instead of %d for %s from byte %d" % (
+                        downloaded, expected, asset["name"], start
+                    )
+                )
+
+        def request_part(start):
+            request = self._get_asset_request(url2, asset, token)
+            request.add_header(
+                "Range", "bytes=%d-%d" % (start, min(start + part_size, size) - 1)
+            )
+            response = self._open_url(request)
+            if response.getcode() != 206:
+                raise RuntimeError(
+                    "Unable to download %s from byte %d" % (asset["name"], start)
+                )
+            download_part(response, start)
+
+        self.logger.debug("Downloading %s in parts of %d bytes" % (asset["name"], part_size))
+        with ThreadPoolExecutor(max_workers=_SPLIT_DOWNLOAD_PARTS - 1) as executor:
+            futures = [
+                executor.submit(request_part, start)
+                for start in range(part_size, size, part_size)
+            ]
+            # Download the first part while the others are downloaded.
+            download_part(first_response, 0)
+            # Re-raise errors, if any.
+            for future in futures:
+                future.result()
+
+        if (asset.get("digest") or "").startswith("sha256:"):
+            # Parts were written in any order, hash the whole file.
+            with open(tmp_file, "rb") as f:
+                for chunk in iter(lambda: f.read(_DOWNLOAD_CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+        return size
+
+    def _copy_chunks(self, src, dst, sha256=None):
+        """
+        Copy the data from the given file like object to the other one by chunks.
+
+        :param src: A file like object to read from.
+        :param dst: A file like object to write to.
+        :param sha256: Optional hashlib sha256 object to update with the data.
+        :returns: The number of copied bytes.
+        """
+        copied = 0
+        chunk = src.read(_DOWNLOAD_CHUNK_SIZE)
+        while chunk:
+            if sha256:
+                sha256.update(chunk)
+            dst.write(chunk)
+            copied += len(chunk)
+            chunk = src.read(_DOWNLOAD_CHUNK_SIZE)
+        return copied
+
+    def _check_downloaded_asset(self, asset, downloaded, sha256):
+        """
+        Check that the given Github asset was completely and correctly downloaded.
+
+        The size is checked against the asset size and the data sha256 against
+        the asset sha256 digest, if Github provided it.
+
+        :param str asset: A Github asset dictionary.
+        :param int downloaded: The number of downloaded bytes.
+        :param sha256: A hashlib sha256 object updated with the downloaded data.
+        :raises RuntimeError: If the downloaded data is not valid.
+        """
+        if asset.get("size") and downloaded != asset["size"]:
+            raise RuntimeError(
+                "Downloaded %d bytes instead of %d for %s" % (
+                    downloaded, asset["size"], asset["name"]
+                )
+            )
+        digest = asset.get("digest") or ""
+        if digest.startswith("sha256:") and sha256.hexdigest() != digest[len("sha256:"):]:
+            raise RuntimeError(
+                "Invalid sha256 for %s, expected %s got %s" % (
+                    asset["name"], digest, sha256.hexdigest()
+                )
+            )
+
+    def _extract_zip(self, zip_file, destination):
+        """
+        Extract the given zip archive into the given destination folder.
+
+        Members are extracted one by one and copied in chunks, so memory usage
+        stays bounded regardless of the size of the archived files.
+
+        :param str zip_file: Full path to a zip archive.
+        :param str destination: Full path to the folder where to extract the archive.
+        :raises RuntimeError: If a member would be extracted outside of the
+                              destination folder.
+        """
+        root = os.path.realpath(destination)
+        with zipfile.ZipFile(zip_file, "r") as zip_ref:
+            for info in zip_ref.infolist():
+                target = self._get_zip_member_path(root, info.filename)
+                if not target:
+                    # A directory entry
+                    continue
+                with zip_ref.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, _DOWNLOAD_CHUNK_SIZE)
+                # Preserve permissions if they were recorded in the archive,
+                # but keep files writable by their owner: several assets can
+                # contain the same file, which is then overwritten.
+                mode = (info.external_attr >> 16) & 0o777
+                if mode:
+                    os.chmod(target, mode | 0o200)
+
+    def _get_zip_member_path(self, root, name):
+        """
+        Return the full path where the given zip member should be extracted,
+        making sure its parent folder exists.
+
+        :param str root: Full real path to the folder where the archive is extracted.
+        :param str name: The name of the member in the zip archive.
+        :returns: The full path to the member, or ``None`` for directory entries.
+        :raises RuntimeError: If the member would be extracted outside of the
+                              root folder.
+        """
+        target = os.path.realpath(os.path.join(root, name))
+        if not target.startswith(root + os.sep):
+            raise RuntimeError("Invalid zip member %s" % name)
+        if name.endswith("/"):
+            _ensure_folder_exists(target)
+            return None
+        _ensure_folder_exists(os.path.dirname(target))
+        return target